@@ -32,8 +32,14 @@
 # external imports
 from typing import Optional, Dict, Callable, List, Any, Union
 import os
-import sys
+import re
+import hashlib
+import importlib.util
+import sysconfig
+import tempfile
+from importlib.machinery import EXTENSION_SUFFIXES
 from shutil import rmtree
+from bisect import bisect_left, bisect_right
 import numpy as np
 from numpy import f2py
 
@@ -44,7 +50,19 @@ from .numpy_backend import NumpyBackend, PyRatesAssignOp, PyRatesIndexOp, PyRate
 __author__ = "Richard Gast"
 __status__ = "development"
 
-module_counter = 0
+# directory in which compiled Fortran modules are cached. Can be set via the environment variable `PYRATES_CACHE_DIR`
+# and defaults to `$XDG_CACHE_HOME/pyrates` (or `~/.cache/pyrates`). The cache is not size-bounded; it can be cleared
+# by deleting the directory or by calling `clear_cache()`.
+cache_dir = os.environ.get("PYRATES_CACHE_DIR") or \
+            os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "pyrates")
+compiled_funcs = {}
+
+# environment variables through which numpy.distutils picks the Fortran compiler and its flags
+compiler_env_vars = ('FC', 'F77', 'F90', 'FFLAGS', 'F77FLAGS', 'F90FLAGS', 'FOPT', 'FARCH', 'LDFLAGS')
+
+# positions at which long code lines can be broken (signs of exponents of number literals are excluded)
+op_regex = re.compile(r'\*\*|==|!=|<=|>=|(?<![0-9.][eEdD])[+\-]|[*/%<>^]')
+break_regex = re.compile(r'[,) ]')
 
 
 class FortranOp(PyRatesOp):
@@ -208,30 +226,22 @@ class FortranBackend(NumpyBackend):
         ##############
 
         # remove empty layers and operators
-        new_layer_idx = 0
-        for layer_idx, layer in enumerate(self.layers.copy()):
-            for op in layer.copy():
-                if op is None:
-                    layer.pop(layer.index(op))
-            if len(layer) == 0:
-                self.layers.pop(new_layer_idx)
-            else:
-                new_layer_idx += 1
-
-        # remove previously imported rhs_funcs from system
-        if 'rhs_func' in sys.modules:
-            del sys.modules['rhs_func']
+        for layer in self.layers:
+            layer[:] = [op for op in layer if op is not None]
+        self.layers[:] = [layer for layer in self.layers if layer]
 
         # collect state variable and parameter vectors
         state_vars, params, var_map = self._process_vars()
 
         # update state variable getter operations to include the full state variable vector as first argument
         y = self.get_var('y')
+        var_info = []
         for key, (vtype, idx) in var_map.items():
             var = self.get_var(key)
             if vtype == 'state_var' and var.short_name != 'y':
                 var.args[0] = y
                 var.build_op(var.args)
+            var_info.append((var, str(var.dtype), vtype, idx))
 
         # create rhs evaluation function
         ################################
@@ -273,36 +283,18 @@ class FortranBackend(NumpyBackend):
             func_gen.add_linebreak()
 
         # declare variable types
-        func_gen.add_code_line("double precision ")
-        for key in var_map:
-            var = self.get_var(key)
-            if "float" in str(var.dtype) and var.short_name != 'y_delta':
-                func_gen.add_code_line(f"{var.short_name},")
-        if "," in func_gen.code[-1]:
-            func_gen.code[-1] = func_gen.code[-1][:-1]
-        else:
-            func_gen.code.pop(-1)
-        func_gen.add_linebreak()
-        func_gen.add_code_line("integer ")
-        for key in var_map:
-            var = self.get_var(key)
-            if "int" in str(var.dtype):
-                func_gen.add_code_line(f"{var.short_name},")
-        if "," in func_gen.code[-1]:
-            func_gen.code[-1] = func_gen.code[-1][:-1]
-        else:
-            func_gen.code.pop(-1)
-        func_gen.add_linebreak()
+        func_gen.add_declaration("double precision", [var.short_name for var, dtype, _, _ in var_info
+                                                      if "float" in dtype and var.short_name != 'y_delta'])
+        func_gen.add_declaration("integer", [var.short_name for var, dtype, _, _ in var_info if "int" in dtype])
 
         # declare constants
-        args = [None for _ in range(len(params))]
+        args = [None] * len(params)
         func_gen.add_code_line("! declare constants")
         func_gen.add_linebreak()
         updates, indices = [], []
         i = 0
-        for key, (vtype, idx) in var_map.items():
+        for var, _, vtype, idx in var_info:
             if vtype == 'constant':
-                var = params[idx-self.idx_start][1]
                 if var.short_name != 'y_delta':
                     func_gen.add_code_line(f"{var.short_name} = args({idx})")
                     func_gen.add_linebreak()
@@ -315,8 +307,7 @@ class FortranBackend(NumpyBackend):
         # extract state variables from input vector y
         func_gen.add_code_line("! extract state variables from input vector")
         func_gen.add_linebreak()
-        for key, (vtype, idx) in var_map.items():
-            var = self.get_var(key)
+        for var, _, vtype, _ in var_info:
             if vtype == 'state_var':
                 func_gen.add_code_line(f"{var.short_name} = {var.value}")
                 func_gen.add_linebreak()
@@ -352,20 +343,15 @@ class FortranBackend(NumpyBackend):
         func_gen.add_linebreak()
         func_gen.remove_indent()
 
-        # save rhs function to file
+        # save rhs function to file and compile it
         fname = f'{self._build_dir}/rhs_func'
-        f2py.compile(func_gen.generate(), modulename='rhs_func', extension='.f', source_fn=f'{fname}.f', verbose=False)
+        rhs_eval = f2py_compile(func_gen.generate(), modulename='rhs_func', source_fn=f'{fname}.f').func
 
         # create additional subroutines in pyauto compatibility mode
         gen_def = kwargs.pop('generate_auto_def', True)
         if self.pyauto_compat and gen_def:
             self.generate_auto_def(self._build_dir)
 
-        # import function from file
-        fname_import = fname.replace('/', '.')
-        exec(f"from rhs_func import rhs_eval", globals())
-        rhs_eval = globals().pop('func')
-
         # apply function decorator
         if decorator:
             rhs_eval = decorator(rhs_eval, **kwargs)
@@ -432,27 +418,10 @@ class FortranBackend(NumpyBackend):
         func_gen.add_linebreak()
 
         # declare variable types
-        func_gen.add_code_line("double precision ")
-        for key in self.vars:
-            var = self.get_var(key)
-            name = var.short_name
-            if "float" in str(var.dtype) and name != 'y_delta' and name != 'y' and name != 't':
-                func_gen.add_code_line(f"{var.short_name},")
-        if "," in func_gen.code[-1]:
-            func_gen.code[-1] = func_gen.code[-1][:-1]
-        else:
-            func_gen.code.pop(-1)
-        func_gen.add_linebreak()
-        func_gen.add_code_line("integer ")
-        for key in self.vars:
-            var = self.get_var(key)
-            if "int" in str(var.dtype):
-                func_gen.add_code_line(f"{var.short_name},")
-        if "," in func_gen.code[-1]:
-            func_gen.code[-1] = func_gen.code[-1][:-1]
-        else:
-            func_gen.code.pop(-1)
-        func_gen.add_linebreak()
+        var_info = [(var, str(var.dtype)) for var in self.vars.values()]
+        func_gen.add_declaration("double precision", [var.short_name for var, dtype in var_info if "float" in dtype
+                                                      and var.short_name not in ('y_delta', 'y', 't')])
+        func_gen.add_declaration("integer", [var.short_name for var, dtype in var_info if "int" in dtype])
 
         _, params, var_map = self._process_vars()
 
@@ -468,23 +437,29 @@ class FortranBackend(NumpyBackend):
 
         # define initial state
         func_gen.add_linebreak()
-        npar = 0
+        arg_values = {}
         for key, (vtype, idx) in var_map.items():
             if vtype == 'constant':
                 var = params[idx-self.idx_start][1]
                 if var.short_name != 'y_delta' and var.short_name != 'y':
-                    func_gen.add_code_line(f"args({idx}) = {var.short_name}")
-                    func_gen.add_linebreak()
-                    if idx > npar:
-                        npar = idx
+                    arg_values[idx] = var.short_name
+        func_gen.add_array_assignment('args', arg_values)
+        npar = max(arg_values, default=0)
         func_gen.add_linebreak()
 
         func_gen.add_linebreak()
+        y_values = {}
         for key, (vtype, idx) in var_map.items():
             var = self.get_var(key)
             if vtype == 'state_var':
-                func_gen.add_code_line(f"{var.value} = {var.numpy()}")
-                func_gen.add_linebreak()
+                y_idx = re.fullmatch(r'y\((\d+)\)', var.value)
+                if y_idx:
+                    y_values[int(y_idx.group(1))] = np.format_float_scientific(var.numpy(), exp_digits=1)\
+                        .replace('e', 'd')
+                else:
+                    func_gen.add_code_line(f"{var.value} = {var.numpy()}")
+                    func_gen.add_linebreak()
+        func_gen.add_array_assignment('y', y_values)
         func_gen.add_linebreak()
 
         # end subroutine
@@ -668,6 +643,13 @@ class FortranBackend(NumpyBackend):
                 c_idx += 1
         return state_vars, constants, var_map
 
+    @staticmethod
+    def _process_func_args(args, var_map, dt):
+        args = NumpyBackend._process_func_args(args, var_map, dt)
+
+        # pass the parameters as a single float64 vector, such that f2py does not have to convert them at every call
+        return np.asarray([0.0 if arg is None or type(arg) is tuple else arg for arg in args], dtype=np.float64)
+
     @staticmethod
     def _compare_shapes(op1: Any, op2: Any, index=False) -> bool:
         """Checks whether the shapes of op1 and op2 are compatible with each other.
@@ -686,22 +668,12 @@ class FortranBackend(NumpyBackend):
 
         """
 
-        if hasattr(op1, 'shape') and hasattr(op2, 'shape'):
-            if op1.shape == op2.shape:
-                return True
-            elif len(op1.shape) > 1 and len(op2.shape) > 1:
-                return True
-            elif len(op1.shape) == 0 and len(op2.shape) == 0:
-                return True
-            else:
-                return False
-        elif hasattr(op1, 'shape'):
-            if sum(op1.shape) > 0:
-                return False
-            else:
-                return True
-        else:
+        shape1, shape2 = getattr(op1, 'shape', None), getattr(op2, 'shape', None)
+        if shape1 is None:
             return True
+        elif shape2 is None:
+            return sum(shape1) == 0
+        return shape1 == shape2 or (len(shape1) > 1 and len(shape2) > 1) or (len(shape1) == 0 and len(shape2) == 0)
 
 
 class FortranGen(CodeGen):
@@ -721,41 +693,160 @@ class FortranGen(CodeGen):
             code_line = "\t" * self.lvl + code_line
         n = 60
         if len(code_line) > n:
-            idx = self._find_first_op(code_line, start=0, stop=n)
-            self.code.append(f"{code_line[0:idx]}")
-            while idx < len(code_line):
+            breaks = self._find_line_breaks(code_line, n)
+            self.code.append(code_line[:breaks[0]])
+            for start, stop in zip(breaks[:-1], breaks[1:]):
                 self.add_linebreak()
-                idx_new = self._find_first_op(code_line, start=idx, stop=idx+n)
-                self.code.append(f"     & {code_line[idx:idx+idx_new]}")
-                idx += idx_new
+                self.code.append(f"     & {code_line[start:stop]}")
         else:
             self.code.append(code_line)
 
+    def add_declaration(self, dtype, names):
+        """Adds a single declaration of all variables of the same type. Nothing is added if there are no variables.
+        """
+        if names:
+            self.add_code_line(f"{dtype} {','.join(names)}")
+            self.add_linebreak()
+
+    def add_array_assignment(self, name, values):
+        """Adds assignments of values to the entries of a 1D array. Each run of consecutive indices is assigned via a
+        single array constructor.
+
+        Parameters
+        ----------
+        name
+            Name of the array.
+        values
+            Code strings of the values, keyed by their (1-based) index in the array.
+
+        Returns
+        -------
+        None
+
+        """
+        indices = sorted(values)
+        runs = []
+        for idx in indices:
+            if runs and idx == runs[-1][-1] + 1:
+                runs[-1].append(idx)
+            else:
+                runs.append([idx])
+        for run in runs:
+            if len(run) == 1:
+                self.add_code_line(f"{name}({run[0]}) = {values[run[0]]}")
+            else:
+                self.add_code_line(f"{name}({run[0]}:{run[-1]}) = [{', '.join([values[idx] for idx in run])}]")
+            self.add_linebreak()
+
     @staticmethod
-    def _find_first_op(code, start, stop):
-        if stop < len(code):
-            code_tmp = code[start:stop]
-            ops = ["+", "-", "*", "/", "**", "^", "%", "<", ">", "==", "!=", "<=", ">="]
-            indices = [code_tmp.index(op) for op in ops if op in code_tmp]
-            if indices and max(indices) > 0:
-                return max(indices)
-            idx = start
-            for break_sign in [',', ')', ' ']:
-                if break_sign in code_tmp:
-                    idx_tmp = len(code_tmp) - code_tmp[::-1].index(break_sign)
-                    if len(code_tmp)-idx_tmp < len(code_tmp)-idx:
-                        idx = idx_tmp
-            return idx
-        return stop
+    def _find_line_breaks(code, n):
+        """Finds the positions at which a code line has to be broken, such that no part of it is longer than `n`.
+        Lines are preferably broken in front of operators, then behind commas, brackets or spaces.
+        """
+        ops = [m.start() for m in op_regex.finditer(code)]
+        signs = [m.end() for m in break_regex.finditer(code)]
+        breaks, start = [], 0
+        while len(code) - start > n:
+            stop = start + n
+            i, j = bisect_left(ops, stop) - 1, bisect_right(signs, stop) - 1
+            if i >= 0 and ops[i] > start:
+                start = ops[i]
+            elif j >= 0 and signs[j] > start:
+                start = signs[j]
+            else:
+                start = stop
+            breaks.append(start)
+        breaks.append(len(code))
+        return breaks
+
+
+def f2py_compile(source: str, modulename: str, build_dir: str = '', source_fn: Optional[str] = None,
+                 extra_args: Optional[List[str]] = None) -> Any:
+    """Compiles Fortran source code into an extension module via f2py and imports it. Compiled modules are stored in
+    `cache_dir` under a hash of their source code and of everything else that affects the build (numpy version,
+    Python extension suffix, f2py arguments and Fortran compiler settings from the environment), such that identical
+    source code is only compiled once per build configuration.
+
+    Parameters
+    ----------
+    source
+        Fortran source code.
+    modulename
+        Prefix of the module name. The hash of the source code is appended to it.
+    build_dir
+        Directory the source code file is written to.
+    source_fn
+        Name of the source code file. Defaults to the module name.
+    extra_args
+        Additional command line arguments for f2py, e.g. compiler flags.
+
+    Returns
+    -------
+    Any
+        Imported extension module.
+
+    """
+
+    extra_args = extra_args if extra_args else []
+    build_config = [np.__version__, sysconfig.get_config_var('EXT_SUFFIX') or EXTENSION_SUFFIXES[0]] + extra_args + \
+                   [f"{key}={os.environ.get(key, '')}" for key in compiler_env_vars]
+    h = hashlib.blake2b("\n".join(build_config + [source]).encode(), digest_size=8).hexdigest()
+    modulename = f"{modulename}_{h}"
+    if not source_fn:
+        source_fn = f"{build_dir}/{modulename}.f" if build_dir else f"{modulename}.f"
+    with open(source_fn, 'w') as f:
+        f.write(source)
+
+    # look for the compiled module in the cache
+    fn = os.path.join(cache_dir, f"{modulename}{EXTENSION_SUFFIXES[0]}")
+    if not os.path.exists(fn):
+
+        # compile the module in a private directory (f2py writes it into the working directory) and move it into the
+        # cache, such that concurrent processes compiling the same module do not interfere with each other
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f"{modulename}_", dir=cache_dir)
+        cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            status = f2py.compile(source, modulename=modulename, extra_args=extra_args, extension='.f',
+                                  source_fn=os.path.basename(source_fn), verbose=False)
+            fn_build = [f"{modulename}{suffix}" for suffix in EXTENSION_SUFFIXES
+                        if os.path.exists(f"{modulename}{suffix}")]
+            if not status and fn_build:
+                os.replace(fn_build[0], fn)
+        finally:
+            os.chdir(cwd)
+            rmtree(tmp_dir, ignore_errors=True)
+
+        # a module that is already in the cache has been compiled by another process in the meantime
+        if not os.path.exists(fn):
+            raise RuntimeError(f'Compilation of the Fortran module {modulename} failed.')
+
+    # import the module
+    spec = importlib.util.spec_from_file_location(modulename, fn)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def clear_cache() -> None:
+    """Removes all compiled Fortran modules from `cache_dir`.
+    """
+    rmtree(cache_dir, ignore_errors=True)
 
 
 def generate_func(self, return_key='f', omit_assign=False, return_dim=None, return_intent='out'):
     """Generates a function from operator value and arguments"""
 
-    global module_counter
+    func_dict = {}
+
+    # non-constant operations are inlined into the rhs function, such that they only need to provide their result shape
+    # (index operations are still evaluated, since they provide the current values of the state variables)
+    if not self.is_constant and not isinstance(self, FortranIndexOp):
+        func_dict[self.short_name] = lambda *args: np.zeros(return_dim) if return_dim else 0.0
+        return func_dict
 
     # function head
-    func_dict = {}
     func = FortranGen()
     func.add_linebreak()
     func.add_indent()
@@ -783,10 +874,14 @@ def generate_func(self, return_key='f', omit_assign=False, return_dim=None, retu
     func.add_code_line("end")
     func.add_linebreak()
     func.remove_indent()
-    module_counter += 1
-    fn = f"pyrates_func_{module_counter}"
-    f2py.compile(func.generate(), modulename=fn, extension=".f", verbose=False,
-                 source_fn=f"{self.build_dir}/{fn}.f" if self.build_dir else f"{fn}.f")
-    exec(f"from pyrates_func_{module_counter} import {fname}", globals())
-    func_dict[self.short_name] = globals().pop(fname)
+
+    # re-use subroutines that have already been compiled from the same source code
+    func_str = func.generate()
+    if func_str in compiled_funcs:
+        func_dict[self.short_name] = compiled_funcs[func_str]
+        return func_dict
+
+    module = f2py_compile(func_str, modulename='pyrates_func', build_dir=self.build_dir)
+    func_dict[self.short_name] = getattr(module, fname)
+    compiled_funcs[func_str] = func_dict[self.short_name]
     return func_dict
@@ -32,7 +32,7 @@
 
 # external imports
 import numpy as np
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 
 # meta infos
 __author__ = "Richard Gast"
@@ -64,19 +64,34 @@ def pr_interp_nd_linear(x, y, x_new, y_idx, t):
 
 
 def pr_interp_1d(x, y, x_new):
-    return interp1d(x, y, kind=3, axis=-1)(x_new)
+    idx = np.argsort(x)
+    x = x[idx]
+    if np.any(x_new < x[0]) or np.any(x_new > x[-1]):
+        raise ValueError("A value in x_new is outside of the interpolation range.")
+    return make_interp_spline(x, y[..., idx], k=3, axis=-1)(x_new, extrapolate=False)
 
 
 def pr_interp_nd(x, y, x_new, y_idx, t):
     try:
-        f = interp1d(x, y, kind=3, axis=-1, fill_value='extrapolate', copy=False)
+        idx = np.argsort(x)
+        f = make_interp_spline(x[idx], y[:, idx], k=3, axis=-1)
     except ValueError:
         try:
             x, idx = np.unique(x, return_index=True)
-            f = interp1d(x, y[:, idx], kind=3, axis=-1, copy=False, fill_value='extrapolate')
+            f = make_interp_spline(x, y[:, idx], k=3, axis=-1)
         except ValueError:
-            f = interp1d(x, y[:, idx], kind='linear', axis=-1, copy=False, fill_value='extrapolate')
-    return np.asarray([f(x_new_tmp)[i] for i, x_new_tmp in zip(y_idx, t-x_new)])
+            return np.asarray([_interp_linear_extrapolate(x_new_tmp, x, y[i, idx])
+                               for i, x_new_tmp in zip(y_idx, t-x_new)])
+    return f(t-x_new)[y_idx, np.arange(len(y_idx))]
+
+
+def _interp_linear_extrapolate(x_new, x, y):
+    """Linear interpolation via `np.interp` that extrapolates along the end segments instead of clamping.
+    Expects `x` to be sorted and to contain at least 2 points.
+    """
+    y_new = np.interp(x_new, x, y)
+    y_new = np.where(x_new < x[0], y[0] + (x_new - x[0]) * (y[1] - y[0]) / (x[1] - x[0]), y_new)
+    return np.where(x_new > x[-1], y[-1] + (x_new - x[-1]) * (y[-1] - y[-2]) / (x[-1] - x[-2]), y_new)
 
 
 def pr_interp(f, x_new):
@@ -49,6 +49,7 @@ import numpy as np
 from copy import deepcopy
 import os
 import sys
+import importlib.util
 from shutil import rmtree
 import warnings
 from scipy.interpolate.interpolate import interp1d
@@ -460,17 +461,9 @@ class PyRatesOp:
     def _check_numerics(vals: NumpyVar, name: str):
         """Checks whether function evaluation leads to any NaNs or infinite values.
         """
-        check = []
-        try:
-            if hasattr(vals, 'shape'):
-                vals = vals.numpy().flatten() if hasattr(vals, 'numpy') else vals.flatten()
-            else:
-                vals = [vals]
-            for val in vals:
-                check.append(np.isnan(val) or np.isneginf(val))
-        except TypeError:
-            check.append(np.isnan(vals) or np.isneginf(vals))
-        if any(check):
+        if hasattr(vals, 'shape') and hasattr(vals, 'numpy'):
+            vals = vals.numpy()
+        if np.any(np.isnan(vals)) or np.any(np.isneginf(vals)):
             raise ValueError(f'Result of operation ({name}) contains NaNs or infinite values.')
 
     @staticmethod
@@ -1541,8 +1534,6 @@ class NumpyBackend(object):
         self.var_counter = 0
         self.layer = 0
         rmtree(self._build_dir)
-        if 'rhs_func' in sys.modules:
-            del sys.modules['rhs_func']
 
     def get_layer(self, idx) -> list:
         """Retrieve layer from graph.
@@ -1610,19 +1601,9 @@ class NumpyBackend(object):
         ##############
 
         # remove empty layers and operators
-        new_layer_idx = 0
-        for layer_idx, layer in enumerate(self.layers.copy()):
-            for op in layer.copy():
-                if op is None:
-                    layer.pop(layer.index(op))
-            if len(layer) == 0:
-                self.layers.pop(new_layer_idx)
-            else:
-                new_layer_idx += 1
-
-        # remove previously imported rhs_funcs from system
-        if 'rhs_func' in sys.modules:
-            del sys.modules['rhs_func']
+        for layer in self.layers:
+            layer[:] = [op for op in layer if op is not None]
+        self.layers[:] = [layer for layer in self.layers if layer]
 
         # collect state variable and parameter vectors
         state_vars, params, var_map = self._process_vars()
@@ -1652,7 +1633,7 @@ class NumpyBackend(object):
         func_gen.add_linebreak()
 
         # declare constants
-        args = [None for _ in range(len(params))]
+        args = [None] * len(params)
         func_gen.add_code_line("# declare constants")
         func_gen.add_linebreak()
         updates, indices = [], []
@@ -1695,13 +1676,15 @@ class NumpyBackend(object):
         func_gen.add_linebreak()
 
         # update parameters where necessary
-        func_gen.add_code_line("# update system parameters")
-        func_gen.add_linebreak()
-        for upd, idx in arg_updates:
-            update_str = f"params[{idx}] = {upd}"
-            if f"    {update_str}" not in func_gen.code:
-                func_gen.add_code_line(update_str)
-                func_gen.add_linebreak()
+        if arg_updates:
+            func_gen.add_code_line("# update system parameters")
+            func_gen.add_linebreak()
+            added_updates = set()
+            for upd, idx in arg_updates:
+                if (upd, idx) not in added_updates:
+                    added_updates.add((upd, idx))
+                    func_gen.add_code_line(f"params[{idx}] = {upd}")
+                    func_gen.add_linebreak()
 
         # add return line
         func_gen.add_code_line(f"return {self.vars['y_delta'].short_name}")
@@ -1714,8 +1697,10 @@ class NumpyBackend(object):
             f.close()
 
         # import function from file
-        exec(f"from rhs_func import rhs_eval", globals())
-        rhs_eval = globals().pop('rhs_eval')
+        spec = importlib.util.spec_from_file_location('rhs_func', f'{fname}.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        rhs_eval = module.rhs_eval
 
         # apply function decorator
         if decorator:
@@ -1902,8 +1887,9 @@ class NumpyBackend(object):
 
             from scipy.integrate import solve_ivp
 
-            # solve via scipy's ode integration function
-            fun = lambda t, y: rhs_func(t, y, func_args)
+            # solve via scipy's ode integration function (the rhs function may return the same y_delta vector at every
+            # call, but scipy keeps references to the returned values)
+            fun = lambda t, y: rhs_func(t, y, func_args).copy()
             if dts:
                 times = np.arange(0, T, dts)
                 kwargs['t_eval'] = times
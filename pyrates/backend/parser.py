@@ -97,6 +97,9 @@ class ExpressionParser(ParserElement):
 
     """
 
+    # parsed tokens and expression stacks of all expression strings parsed so far
+    _expr_cache = {}
+
     def __init__(self, expr_str: str, args: dict, backend: tp.Any, **kwargs) -> None:
         """Instantiates expression parser.
         """
@@ -131,93 +134,122 @@ class ExpressionParser(ParserElement):
         self._finished_rhs = False
         self._instantaneous = kwargs.pop('instantaneous', False)
 
-        # define algebra
-        ################
-
-        if not self.expr:
-
-            # general symbols
-            point = Literal(".")
-            comma = Literal(",")
-            colon = Literal(":")
-            e = CaselessLiteral("E")
-            pi = CaselessLiteral("PI")
-
-            # parentheses
-            par_l = Literal("(")
-            par_r = Literal(")").setParseAction(self._push_first)
-            idx_l = Literal("[")
-            idx_r = Literal("]")
-
-            # basic mathematical operations
-            plus = Literal("+")
-            minus = Literal("-")
-            mult = Literal("*")
-            div = Literal("/")
-            mod = Literal("%")
-            dot = Literal("@")
-            exp_1 = Literal("^")
-            exp_2 = Combine(mult + mult)
-            transp = Combine(point + Literal("T"))
-            inv = Combine(point + Literal("I"))
-
-            # numeric types
-            num_float = Combine(Word("-" + nums, nums) +
-                                Optional(point + Optional(Word(nums))) +
-                                Optional(e + Word("-" + nums, nums)))
-            num_int = Word("-" + nums, nums)
-
-            # variables and functions
-            name = Word(alphas, alphas + nums + "_$")
-            func_name = Combine(name + par_l, adjacent=True)
-
-            # math operation groups
-            op_add = plus | minus
-            op_mult = mult | div | dot | mod
-            op_exp = exp_1 | exp_2 | inv | transp
-
-            # logical operations
-            greater = Literal(">")
-            less = Literal("<")
-            equal = Combine(Literal("=") + Literal("="))
-            unequal = Combine(Literal("!") + Literal("="))
-            greater_equal = Combine(Literal(">") + Literal("="))
-            less_equal = Combine(Literal("<") + Literal("="))
-
-            # logical operations group
-            op_logical = greater_equal | less_equal | unequal | equal | less | greater
-
-            # pre-allocations
-            self.expr = Forward()
-            exponential = Forward()
-            index_multiples = Forward()
-
-            # basic organization units
-            index_start = idx_l.setParseAction(self._push_first)
-            index_end = idx_r.setParseAction(self._push_first)
-            index_comb = colon.setParseAction(self._push_first)
-            arg_comb = comma.setParseAction(self._push_first)
-            arg_tuple = par_l + ZeroOrMore(self.expr.suppress() + Optional(arg_comb)) + par_r
-            func_arg = arg_tuple | self.expr.suppress()
-
-            # basic computation unit
-            atom = (func_name + Optional(func_arg.suppress()) + ZeroOrMore(arg_comb.suppress() + func_arg.suppress()) +
-                    par_r.suppress() | name | pi | e | num_float | num_int).setParseAction(self._push_neg_or_first) | \
-                   (par_l.setParseAction(self._push_last) + self.expr.suppress() + par_r).setParseAction(self._push_neg)
-
-            # apply indexing to atoms
-            indexed = (Optional(minus) + atom).setParseAction(self._push_neg) + \
-                      ZeroOrMore((index_start + index_multiples + index_end))
-            index_base = (self.expr.suppress() | index_comb)
-            index_full = index_base + ZeroOrMore((index_comb + index_base)) + ZeroOrMore(index_comb)
-            index_multiples << index_full + ZeroOrMore((arg_comb + index_full))
-
-            # hierarchical relationships between mathematical and logical operations
-            boolean = indexed + Optional((op_logical + indexed).setParseAction(self._push_first))
-            exponential << boolean + ZeroOrMore((op_exp + Optional(exponential)).setParseAction(self._push_first))
-            factor = exponential + ZeroOrMore((op_mult + exponential).setParseAction(self._push_first))
-            expr = factor + ZeroOrMore((op_add + factor).setParseAction(self._push_first))
-            self.expr << expr #(Optional(minus) + expr).setParseAction(self._push_neg)
+    def _parse_expr_str(self, expr_str: str) -> list:
+        """Parses an expression string onto the expression stack and returns the list of parsed tokens. Since the
+        expression stack only depends on the expression string, it is shared between all parser instances and the
+        grammar is only defined for parser instances that encounter an expression string for the first time.
+
+        Parameters
+        ----------
+        expr_str
+            Expression string to be parsed.
+
+        Returns
+        -------
+        list
+            Parsed tokens of the expression string.
+        """
+
+        try:
+            expr_list, expr_stack = ExpressionParser._expr_cache[expr_str]
+        except KeyError:
+            if self.expr is None:
+                self._define_algebra()
+            n = len(self.expr_stack)
+            expr_list = tuple(self.expr.parseString(expr_str))
+            expr_stack = tuple(self.expr_stack[n:])
+            ExpressionParser._expr_cache[expr_str] = (expr_list, expr_stack)
+        else:
+            self.expr_stack.extend(expr_stack)
+        return list(expr_list)
+
+    def _define_algebra(self) -> None:
+        """Defines the pyparsing grammar of mathematical expressions, which pushes all parsed symbols and operations
+        onto the expression stack.
+        """
+
+        # general symbols
+        point = Literal(".")
+        comma = Literal(",")
+        colon = Literal(":")
+        e = CaselessLiteral("E")
+        pi = CaselessLiteral("PI")
+
+        # parentheses
+        par_l = Literal("(")
+        par_r = Literal(")").setParseAction(self._push_first)
+        idx_l = Literal("[")
+        idx_r = Literal("]")
+
+        # basic mathematical operations
+        plus = Literal("+")
+        minus = Literal("-")
+        mult = Literal("*")
+        div = Literal("/")
+        mod = Literal("%")
+        dot = Literal("@")
+        exp_1 = Literal("^")
+        exp_2 = Combine(mult + mult)
+        transp = Combine(point + Literal("T"))
+        inv = Combine(point + Literal("I"))
+
+        # numeric types
+        num_float = Combine(Word("-" + nums, nums) +
+                            Optional(point + Optional(Word(nums))) +
+                            Optional(e + Word("-" + nums, nums)))
+        num_int = Word("-" + nums, nums)
+
+        # variables and functions
+        name = Word(alphas, alphas + nums + "_$")
+        func_name = Combine(name + par_l, adjacent=True)
+
+        # math operation groups
+        op_add = plus | minus
+        op_mult = mult | div | dot | mod
+        op_exp = exp_1 | exp_2 | inv | transp
+
+        # logical operations
+        greater = Literal(">")
+        less = Literal("<")
+        equal = Combine(Literal("=") + Literal("="))
+        unequal = Combine(Literal("!") + Literal("="))
+        greater_equal = Combine(Literal(">") + Literal("="))
+        less_equal = Combine(Literal("<") + Literal("="))
+
+        # logical operations group
+        op_logical = greater_equal | less_equal | unequal | equal | less | greater
+
+        # pre-allocations
+        self.expr = Forward()
+        exponential = Forward()
+        index_multiples = Forward()
+
+        # basic organization units
+        index_start = idx_l.setParseAction(self._push_first)
+        index_end = idx_r.setParseAction(self._push_first)
+        index_comb = colon.setParseAction(self._push_first)
+        arg_comb = comma.setParseAction(self._push_first)
+        arg_tuple = par_l + ZeroOrMore(self.expr.suppress() + Optional(arg_comb)) + par_r
+        func_arg = arg_tuple | self.expr.suppress()
+
+        # basic computation unit
+        atom = (func_name + Optional(func_arg.suppress()) + ZeroOrMore(arg_comb.suppress() + func_arg.suppress()) +
+                par_r.suppress() | name | pi | e | num_float | num_int).setParseAction(self._push_neg_or_first) | \
+               (par_l.setParseAction(self._push_last) + self.expr.suppress() + par_r).setParseAction(self._push_neg)
+
+        # apply indexing to atoms
+        indexed = (Optional(minus) + atom).setParseAction(self._push_neg) + \
+                  ZeroOrMore((index_start + index_multiples + index_end))
+        index_base = (self.expr.suppress() | index_comb)
+        index_full = index_base + ZeroOrMore((index_comb + index_base)) + ZeroOrMore(index_comb)
+        index_multiples << index_full + ZeroOrMore((arg_comb + index_full))
+
+        # hierarchical relationships between mathematical and logical operations
+        boolean = indexed + Optional((op_logical + indexed).setParseAction(self._push_first))
+        exponential << boolean + ZeroOrMore((op_exp + Optional(exponential)).setParseAction(self._push_first))
+        factor = exponential + ZeroOrMore((op_mult + exponential).setParseAction(self._push_first))
+        expr = factor + ZeroOrMore((op_add + factor).setParseAction(self._push_first))
+        self.expr << expr #(Optional(minus) + expr).setParseAction(self._push_neg)
 
     def parse_expr(self) -> tuple:
         """Parses string-based mathematical expression/equation.
@@ -229,7 +261,7 @@ class ExpressionParser(ParserElement):
         """
 
         # extract symbols and operations from equations right-hand side
-        self.expr_list = self.expr.parseString(self.rhs)
+        self.expr_list = self._parse_expr_str(self.rhs)
         self._check_parsed_expr(self.rhs)
 
         # parse rhs into backend
@@ -242,7 +274,7 @@ class ExpressionParser(ParserElement):
         self._finished_rhs = True
 
         # extract symbols and operations from left-hand side
-        self.expr_list = self.expr.parseString(self.lhs)
+        self.expr_list = self._parse_expr_str(self.lhs)
         self._check_parsed_expr(self.lhs)
 
         # parse lhs into backend
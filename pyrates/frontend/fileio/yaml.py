@@ -29,9 +29,19 @@
 """
 
 
+import os
+from copy import deepcopy
+from functools import lru_cache
+from pathlib import Path
+
+from ruamel.yaml import YAML
+
 __author__ = "Daniel Rose"
 __status__ = "Development"
 
+# uses the C-based parser if ruamel.yaml was installed with it and falls back to the pure python parser otherwise
+_safe_yaml = YAML(typ="safe")
+
 
 def dict_from_yaml(path: str):
     """Load a template from YAML and return the resulting dictionary.
@@ -47,13 +57,12 @@ def dict_from_yaml(path: str):
         absolute or relative path from the current working directory. In either case the second-to-last part refers to
         the filename without file extension and the last part refers to the template name.
     """
+    # imported here, since pyrates.frontend.file imports this module
     from pyrates.frontend.file import parse_path
 
     template_name, filename, directory = parse_path(path)
 
     # test if file can be found (and potentially add extension)
-    import os
-
     if "." in filename:
         filepath = os.path.join(directory, filename)
     else:
@@ -65,16 +74,11 @@ def dict_from_yaml(path: str):
         else:
             raise FileNotFoundError(f"Could not identify file with name {filename} in directory {directory}.")
 
-    # load as yaml file
-    from ruamel.yaml import YAML
-
-    yaml = YAML(typ="safe", pure=True)
-
-    with open(filepath, "r") as file:
-        file_dict = yaml.load(file)
+    # load as yaml file (the parsed file is shared between calls, so the template is copied before it is altered)
+    file_dict = _load_yaml_file(filepath, os.stat(filepath).st_mtime_ns)
 
     if template_name in file_dict:
-        template_dict = file_dict[template_name]
+        template_dict = deepcopy(file_dict[template_name])
         template_dict["path"] = path
         template_dict["name"] = template_name
     else:
@@ -83,6 +87,16 @@ def dict_from_yaml(path: str):
     return template_dict
 
 
+@lru_cache(maxsize=512)
+def _load_yaml_file(filepath: str, mtime: int) -> dict:
+    """Parse a YAML file. Results are cached by file path and modification time, such that files with multiple
+    templates are only parsed once, unless they change on disk.
+    """
+    # the raw bytes are handed to the parser, which takes care of decoding them
+    with open(filepath, "rb") as file:
+        return _safe_yaml.load(file.read())
+
+
 # def from_circuit(circuit, path: str, name: str):
 #     """Interface to dump a CircuitIR instance to YAML."""
 #     from pyrates.frontend.dict import from_circuit as dict_from_circuit
@@ -106,9 +120,7 @@ def dump(_dict: dict, filename: str, template_name: str, **kwargs):
 
     _dict = {template_name: _dict}
 
-    from ruamel.yaml import YAML
     yaml = YAML()
 
-    from pathlib import Path
     path = Path(filename)
     yaml.dump(_dict, path, **kwargs)
@@ -71,8 +71,8 @@ class NodeIR(AbstractBaseIR):
     def operators(self):
         return self.op_graph.operators
 
-    def __hash__(self):
-        raise NotImplementedError
+    # nodes are compared by identity, so the identity hash can be used instead of the operator graph hash
+    __hash__ = object.__hash__
 
 
 class VectorizedNodeIR(AbstractBaseIR):
@@ -83,14 +83,8 @@ class VectorizedNodeIR(AbstractBaseIR):
     def __init__(self, node_ir: NodeIR):
 
         super().__init__(node_ir.template)
+        # the operator graph reformats all values to be lists of themselves (adding an outer vector dimension)
         self.op_graph = VectorizedOperatorGraph(node_ir.op_graph, node_ir.values)
-        values = {}
-        # reformat all values to be lists of themselves (adding an outer vector dimension)
-        # if len(node_ir.op_graph) == 0:
-        #     op_key, data = next(iter(self.op_graph.node(data=True)))
-        #     for var in data["variables"]:
-        #         values[op_key] = {var: [0.]}
-        # else:
 
         # save current length of this node vector.
         self._length = 1
@@ -108,8 +102,8 @@ class VectorizedNodeIR(AbstractBaseIR):
     def operators(self):
         return self.op_graph.operators
 
-    def __hash__(self):
-        raise NotImplementedError
+    # nodes are compared by identity, so the identity hash can be used instead of the operator graph hash
+    __hash__ = object.__hash__
 
     def extend(self, node: NodeIR):
         """ Extend variables vectors by values from one additional node.
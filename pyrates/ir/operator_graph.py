@@ -223,9 +223,11 @@ class VectorizedOperatorGraph(DiGraph):
                                       output=op.output)
 
                 # retrieve values from value dict and pass them into variable dictionary of operator
-                op_values = deepcopy(values[op_key])
+                # (immutable scalars can be shared, only mutable values need to be copied)
                 op_vars = self.operators[op_key]["variables"]
-                for var_key, value in op_values.items():
+                for var_key, value in values[op_key].items():
+                    if not isinstance(value, (float, int, str)):
+                        value = deepcopy(value)
                     op_vars[var_key]["value"] = [value]
                 # self.operators[op_key]["variables"] = op_vars
 
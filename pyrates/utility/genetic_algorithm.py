@@ -37,8 +37,8 @@ import os
 import sys
 import glob
 import time as t
-from itertools import cycle
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 
 # pyrates imports
 from pyrates.utility.grid_search import grid_search, ClusterGridSearch, linearize_grid, adapt_circuit, ClusterCompute, \
@@ -58,8 +58,12 @@ class GeneticAlgorithmTemplate:
         self.num_genes = 0
         self.sigma_adapt = 0
         self.gene_names = []
+        self._mins = np.empty(0)
+        self._maxs = np.empty(0)
+        self._init_sigmas = np.empty(0)
         self.pop = pd.DataFrame()
         self.pop_size = 0
+        self.gene_keys = set()
         self.candidate = pd.DataFrame()
         self.winner = pd.DataFrame()
         self.current_winners = pd.DataFrame()
@@ -134,6 +138,11 @@ class GeneticAlgorithmTemplate:
         self.num_genes = len(initial_gene_pool)
         self.sigma_adapt = sigma_adapt
 
+        # Gene boundaries and initial sigmas, in the order of the gene names
+        self._mins = np.asarray([gene['min'] for gene in initial_gene_pool.values()], dtype=np.float64)
+        self._maxs = np.asarray([gene['max'] for gene in initial_gene_pool.values()], dtype=np.float64)
+        self._init_sigmas = np.asarray([gene['sigma'] for gene in initial_gene_pool.values()], dtype=np.float64)
+
         # Counts how many members have already been dropped out from a population due to fitness stagnation
         self.drop_count = 0
 
@@ -149,88 +158,37 @@ class GeneticAlgorithmTemplate:
         # Start genetic algorithm
         #########################
         print("***STARTING GENETIC ALGORITHM***")
-        iter_count = 0
-        stagnation_count = 0
-        while iter_count < max_iter:
-
-            print("")
-            print(f'ITERATION: {iter_count}')
-
-            # Evaluate fitness of current population
-            ########################################
-            self.eval_fitness(target, **kwargs)
-            new_candidate = self.pop.nlargest(1, "fitness")
-            self.current_max_fitness = float(new_candidate.loc[:, "fitness"].values)
-
-            # If no population member yields a proper fitness value since all computed timeseries contained at least one
-            # undefined value (e.g. np.NaN)
-            print(f'Fittest gene in current population:')
-            self.plot_genes(new_candidate)
-            target_tmp = []
-            for tar in target:
-                if isinstance(tar, list):
-                    target_tmp.append(np.round(tar, decimals=2))
-                else:
-                    target_tmp.append(np.round(tar, decimals=2))
-            print(f'Target: {target_tmp}')
-
-            # Check for fitness stagnation
-            ##############################
-            if max_stagnation_steps > 0:
-                # Before the first iteration self.candidate is empty. Skip stagnation check in that case
-                if not self.candidate.empty:
-                    old_fitness = np.round(float(self.candidate['fitness']), decimals=stagnation_decimals)
-                    new_fitness = np.round(self.current_max_fitness, decimals=stagnation_decimals)
-                    # Check for change in fitness
-                    if new_fitness <= old_fitness:
-                        stagnation_count += 1
-                        # Check if stagnation occured
-                        if stagnation_count > max_stagnation_steps:
-                            print("Maximum fitness stagnation reached!")
-                            # Check if maximum number of population drops is reached
-                            if not (self.drop_count == max_stagnation_drops) or enforce_max_iter:
-                                if drop_save:
-                                    print("Saving fittest candidate.")
-                                    os.makedirs(drop_save, exist_ok=True)
-                                    self.candidate.to_hdf(f'{drop_save}/PopulationDrop_{self.drop_count}.h5',
-                                                          key='data')
-                                    with h5py.File(f'{drop_save}/PopulationDrop_{self.drop_count}.h5') as file:
-                                        file['target'] = target
-
-                                self.drop_count += 1
-                                self.candidate = pd.DataFrame()
-
-                                if new_pop_on_drop:
-                                    print("Creating new population.")
-                                    self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
-                                    continue
-                                else:
-                                    print("Dropping candidate from population!")
-                                    self.current_winners = self.current_winners.drop(self.candidate.index)
-                            else:
-                                print("Returning fittest member!")
-                                print("")
-                                return self.winner
-                    else:
-                        # Reset stagnation counter
-                        stagnation_count = 0
+        # the candidate file is kept open over all iterations and overwritten with the latest candidate
+        use_store = candidate_save and not pop_save
+        candidate_store = pd.HDFStore(candidate_save, mode="w") if use_store else None
+        try:
+            iter_count = 0
+            stagnation_count = 0
+            while iter_count < max_iter:
 
-            # Update candidate and save if necessary
-            ########################################
-            self.candidate = new_candidate
-            if pop_save:
-                self.pop.to_hdf(f"{pop_save}_{iter_count}.h5", key='data', mode='w')
-            elif candidate_save:
-                self.candidate.to_hdf(candidate_save, key='data', mode='w')
-
-            # Update current winning genes
-            ##############################
-            if self.winner.empty or float(self.candidate['fitness']) > float(self.winner['fitness']):
-                self.winner = self.candidate
-                print('Fittest gene in current population is also the globally fittest gene.')
-            else:
-                print(f'Globally fittest gene:')
-                self.plot_genes(self.winner)
+                print("")
+                print(f'ITERATION: {iter_count}')
+
+                # Evaluate fitness of current population
+                ########################################
+                self.eval_fitness(target, **kwargs)
+                fitness = self.pop['fitness'].to_numpy()
+
+                # If no population member yields a proper fitness value since all computed timeseries contained at least
+                # one undefined value (e.g. np.NaN)
+                if np.all(np.isnan(fitness)):
+                    print(f'No candidate available for the current gene set')
+                    print(f'Generating new population')
+                    self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
+                    iter_count += 1
+                    continue
+
+                best_idx = int(np.nanargmax(fitness))
+                new_candidate = self.pop.iloc[[best_idx]]
+                self.current_max_fitness = float(fitness[best_idx])
+
+                print(f'Fittest gene in current population:')
+                self.plot_genes(new_candidate)
                 target_tmp = []
                 for tar in target:
                     if isinstance(tar, list):
@@ -239,48 +197,117 @@ class GeneticAlgorithmTemplate:
                         target_tmp.append(np.round(tar, decimals=2))
                 print(f'Target: {target_tmp}')
 
-            # Evaluate minimum fitness conversion criteria
-            ##############################################
-            if 0 < min_fit < self.current_max_fitness:
-                print("Minimum fitness criterion reached!")
-                if enforce_max_iter:
-                    if drop_save:
-                        print("Saving winner!")
-                        self.winner.to_hdf(f'{drop_save}/PopulationDrop_{self.drop_count}.h5', key='data')
-                    self.drop_count += 1
-                    stagnation_count = 0
-                    self.winner = pd.DataFrame()
-                    if new_pop_on_drop:
-                        print(f'Generating new population')
-                        self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
-                        continue
-                    else:
-                        print("Dropping candidate from population!")
-                        self.pop = self.pop.drop(new_candidate.index)
-                        self.current_winners = self.current_winners.drop(new_candidate.index)
-                        self.candidate = pd.DataFrame()
+                # Check for fitness stagnation
+                ##############################
+                if max_stagnation_steps > 0:
+                    # Before the first iteration self.candidate is empty. Skip stagnation check in that case
+                    if not self.candidate.empty:
+                        old_fitness = np.round(self.candidate['fitness'].iat[0], decimals=stagnation_decimals)
+                        new_fitness = np.round(self.current_max_fitness, decimals=stagnation_decimals)
+                        # Check for change in fitness
+                        if new_fitness <= old_fitness:
+                            stagnation_count += 1
+                            # Check if stagnation occured
+                            if stagnation_count > max_stagnation_steps:
+                                print("Maximum fitness stagnation reached!")
+                                # Check if maximum number of population drops is reached
+                                if not (self.drop_count == max_stagnation_drops) or enforce_max_iter:
+                                    if drop_save:
+                                        print("Saving fittest candidate.")
+                                        os.makedirs(drop_save, exist_ok=True)
+                                        self.candidate.to_hdf(f'{drop_save}/PopulationDrop_{self.drop_count}.h5',
+                                                              key='data')
+                                        with h5py.File(f'{drop_save}/PopulationDrop_{self.drop_count}.h5') as file:
+                                            file['target'] = target
+
+                                    self.drop_count += 1
+                                    self.candidate = pd.DataFrame()
+
+                                    if new_pop_on_drop:
+                                        print("Creating new population.")
+                                        self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
+                                        continue
+                                    else:
+                                        print("Dropping candidate from population!")
+                                        self.current_winners = self.current_winners.drop(self.candidate.index)
+                                else:
+                                    print("Returning fittest member!")
+                                    print("")
+                                    return self.winner
+                        else:
+                            # Reset stagnation counter
+                            stagnation_count = 0
+
+                # Update candidate and save if necessary
+                ########################################
+                self.candidate = new_candidate
+                if pop_save:
+                    self.pop.to_hdf(f"{pop_save}_{iter_count}.h5", key='data', mode='w')
+                elif candidate_save:
+                    candidate_store.put('data', self.candidate)
+                    candidate_store.flush()
+
+                # Update current winning genes
+                ##############################
+                if self.winner.empty or self.current_max_fitness > self.winner['fitness'].iat[0]:
+                    self.winner = self.candidate
+                    print('Fittest gene in current population is also the globally fittest gene.')
                 else:
-                    return new_candidate
+                    print(f'Globally fittest gene:')
+                    self.plot_genes(self.winner)
+                    target_tmp = []
+                    for tar in target:
+                        if isinstance(tar, list):
+                            target_tmp.append(np.round(tar, decimals=2))
+                        else:
+                            target_tmp.append(np.round(tar, decimals=2))
+                    print(f'Target: {target_tmp}')
+
+                # Evaluate minimum fitness conversion criteria
+                ##############################################
+                if 0 < min_fit < self.current_max_fitness:
+                    print("Minimum fitness criterion reached!")
+                    if enforce_max_iter:
+                        if drop_save:
+                            print("Saving winner!")
+                            self.winner.to_hdf(f'{drop_save}/PopulationDrop_{self.drop_count}.h5', key='data')
+                        self.drop_count += 1
+                        stagnation_count = 0
+                        self.winner = pd.DataFrame()
+                        if new_pop_on_drop:
+                            print(f'Generating new population')
+                            self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
+                            continue
+                        else:
+                            print("Dropping candidate from population!")
+                            self.pop = self.pop.drop(new_candidate.index)
+                            self.current_winners = self.current_winners.drop(new_candidate.index)
+                            self.candidate = pd.DataFrame()
+                    else:
+                        return new_candidate
 
-            # Create offspring from current population
-            ##########################################
+                # Create offspring from current population
+                ##########################################
 
-            if self.current_max_fitness == -0.0:
-                print(f'No candidate available for the current gene set')
-                print(f'Generating new population')
-                self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
-            else:
-                print(f'Generating offspring')
-                self.__create_offspring(n_parent_pairs=n_parent_pairs, n_new=n_new, n_winners=n_winners,
-                                        sampling_func=new_member_sampling_func if new_member_sampling_func
-                                        else gene_sampling_func)
-            iter_count += 1
-
-        # End of iteration loop
-        print("Maximum iterations reached")
-        if float(self.winner['fitness']) < min_fit and self.drop_count == 0:
-            print('Could not satisfy minimum fitness condition.')
-        return self.winner
+                if self.current_max_fitness == -0.0:
+                    print(f'No candidate available for the current gene set')
+                    print(f'Generating new population')
+                    self.__create_pop(sampling_func=gene_sampling_func, permute=permute)
+                else:
+                    print(f'Generating offspring')
+                    self.__create_offspring(n_parent_pairs=n_parent_pairs, n_new=n_new, n_winners=n_winners,
+                                            sampling_func=new_member_sampling_func if new_member_sampling_func
+                                            else gene_sampling_func)
+                iter_count += 1
+
+            # End of iteration loop
+            print("Maximum iterations reached")
+            if self.winner.empty or (self.winner['fitness'].iat[0] < min_fit and self.drop_count == 0):
+                print('Could not satisfy minimum fitness condition.')
+            return self.winner
+        finally:
+            if candidate_store is not None:
+                candidate_store.close()
 
     def __create_offspring(self, n_winners, n_parent_pairs=0, n_new=0, sampling_func=np.random.uniform):
         """Create a new offspring of the current population
@@ -299,66 +326,49 @@ class GeneticAlgorithmTemplate:
         # Create new offspring
         ######################
 
-        offspring = []
-        new_sigs = []
         n_mutations = self.pop_size - (n_parent_pairs + n_new)
 
         # 1. Add n_winners strongest members
         ####################################
-        winners = self.__select_winners(n_winners=n_winners)
-        winner_genes, winner_sigmas = [], []
-        for w in winners:
-            winner_genes.append(w[0])
-            winner_sigmas.append(w[1])
+        winner_genes, winner_sigmas = self.__select_winners(n_winners=n_winners)
 
         # 2. Add children of n_parents parent pairs
         ###########################################
-        parent_pairs = self.__create_parent_pairs(n_parent_pairs=n_parent_pairs)
-        childs = self.__crossover(parent_pairs)
-        for c in childs:
-            offspring.append(c[0])
-            new_sigs.append(c[1])
+        parent_genes, parent_sigmas = self.__create_parent_pairs(n_parent_pairs=n_parent_pairs)
+        child_genes, child_sigmas = self.__crossover(parent_genes, parent_sigmas)
 
         # Each failed child will be replaced by a mutation
-        new_mutations = n_parent_pairs - len(childs)
+        new_mutations = n_parent_pairs - child_genes.shape[0]
         if new_mutations > 0:
             n_mutations += new_mutations
 
         # 3. Add mutations
         ##################
-        parent_pool = cycle(zip(offspring+winner_genes, new_sigs+winner_sigmas))
-        for _ in range(n_mutations):
-            parent = next(parent_pool)
-            mutation = self.__mutate(parent)
-            offspring.append(mutation[0])
-            new_sigs.append(mutation[1])
+        # children and winners are used as parents in turn, until n_mutations parents are chosen
+        pool_genes = np.vstack([child_genes, winner_genes])
+        pool_sigmas = np.vstack([child_sigmas, winner_sigmas])
+        if n_mutations > 0 and pool_genes.shape[0]:
+            parent_idx = np.arange(n_mutations) % pool_genes.shape[0]
+            mut_genes, mut_sigmas = self.__mutate(pool_genes[parent_idx], pool_sigmas[parent_idx])
+        else:
+            mut_genes, mut_sigmas = np.empty((0, self.num_genes)), np.empty((0, self.num_genes))
 
         # 4. Add n_new fresh members from initial gene_pool
         ###################################################
-        for n in range(n_new):
-            new_member = self.__create_new_member(sampling_func=sampling_func)
-            offspring.append(new_member[0])
-            new_sigs.append(new_member[1])
+        new_genes, new_sigmas = self.__create_new_members(n_new, sampling_func=sampling_func)
 
-        offspring = pd.DataFrame(offspring)
+        genes = np.vstack([child_genes, mut_genes, new_genes])
+        sigmas = np.vstack([child_sigmas, mut_sigmas, new_sigmas])
 
         # 5. Swap possible duplicates in the offspring with new members
         ###############################################################
-        while any(offspring.duplicated(keep='first')):
-            dupl_idx = offspring.loc[offspring.duplicated(keep='first')].index.to_numpy()
-            for i in dupl_idx:
-                # Replace every duplicate with a new chromosome, fitness 0.0 and respective sigmas
-                new_member = self.__create_new_member(sampling_func=sampling_func)
-                offspring.iloc[i] = new_member[0]
-                new_sigs[i] = new_member[1]
-
-        offspring.columns = self.pop.loc[:, self.gene_names].columns
-        offspring['fitness'] = 0.0
-        offspring['sigma'] = new_sigs
-        offspring['results'] = [[] for _ in range(len(new_sigs))]
-        offspring.columns = self.pop.columns
-
-        self.pop = offspring
+        dupl_idx = self.__find_duplicates(genes)
+        while dupl_idx.size:
+            # Replace every duplicate with a new chromosome and respective sigmas
+            genes[dupl_idx], sigmas[dupl_idx] = self.__create_new_members(dupl_idx.size, sampling_func=sampling_func)
+            dupl_idx = self.__find_duplicates(genes)
+
+        self.__set_pop(genes, sigmas)
 
     def __create_pop(self, sampling_func=np.linspace, permute=True):
         """Create new population from the initial gene pool"""
@@ -367,134 +377,158 @@ class GeneticAlgorithmTemplate:
         pop_grid = {}
         # Prevent duplicates if create_pop() is called again if population had no winner
         self.gene_names = []
-        sigmas = [self.initial_gene_pool[gene]['sigma'] for gene in self.initial_gene_pool.keys()]
         for param, value in self.initial_gene_pool.items():
             self.gene_names.append(param)
             value_tmp = value.copy()
             value_tmp.pop('sigma')
             pop_grid[param] = self.__sample_gene(sampling_func, **value_tmp)
-        self.pop = linearize_grid(pop_grid, permute=permute)
-        self.pop_size = self.pop.shape[0]
+        genes = linearize_grid(pop_grid, permute=permute).to_numpy(dtype=np.float64)
+        self.__set_pop(genes, np.tile(self._init_sigmas, (genes.shape[0], 1)))
 
+    def __set_pop(self, genes, sigmas):
+        """Create the population data frame from arrays of genes and sigmas (one row per population member)"""
+        self.pop = pd.DataFrame(genes, columns=self.gene_names)
+        self.pop_size = self.pop.shape[0]
         self.pop['fitness'] = 0.0
-        self.pop['sigma'] = [sigmas for _ in range(self.pop_size)]
+        self.pop['sigma'] = sigmas.tolist()
         self.pop['results'] = [[] for _ in range(self.pop_size)]
 
+        # byte representations of all gene sets in the population, used to detect duplicates of population members
+        self.gene_keys = {row.tobytes() for row in genes}
+
+    @staticmethod
+    def __find_duplicates(genes):
+        """Returns the row indices of all gene sets that already occurred in a previous row"""
+        _, idx = np.unique(genes, axis=0, return_index=True)
+        return np.setdiff1d(np.arange(genes.shape[0]), idx)
+
     def __select_winners(self, n_winners):
         """Returns the n_winners fittest members from the current population"""
+        pop_genes, _, pop_fitness = self.__to_arrays(self.pop)
         if self.current_winners.shape[0] == n_winners:
-            for i in range(n_winners):
-                winner = self.pop.nlargest(1, 'fitness').index[0]
-                idx_old = self.current_winners.nsmallest(1, 'fitness').index[0]
-                if self.pop.at[winner, 'fitness'] > self.current_winners.at[idx_old, 'fitness'] and not \
-                        (self.current_winners.loc[:, self.gene_names] == self.pop.loc[winner, self.gene_names]
-                         ).all(1).any():
-                    self.current_winners.loc[idx_old, :] = self.pop.loc[winner, :]
+            # the fittest member replaces the weakest winner, if it is fitter and not among the winners already
+            winner_genes, _, winner_fitness = self.__to_arrays(self.current_winners)
+            winner = int(np.nanargmax(pop_fitness))
+            idx_old = int(np.nanargmin(winner_fitness))
+            if pop_fitness[winner] > winner_fitness[idx_old] and not (winner_genes == pop_genes[winner]).all(1).any():
+                self.current_winners.loc[self.current_winners.index[idx_old], :] = self.pop.iloc[winner]
         else:
-            self.current_winners = self.pop.nlargest(n_winners, 'fitness')
-        return [(self.current_winners.loc[i, self.gene_names], self.current_winners.at[i, 'sigma'])
-                for i in self.current_winners.index]
-
-    def __mutate(self, parent, max_iter=1000):
-        """Create mutation of a parent, based on a gaussian distribution for each gene"""
-        mu_new = []
-        sigma_new = []
-        for i, (mu, sigma) in enumerate(zip(parent[0], parent[1])):
-            mu_tmp = np.random.normal(mu, sigma)
-            sigma_tmp = sigma
-            j = 0
-            while any([mu_tmp < self.initial_gene_pool[self.gene_names[i]]['min'],
-                       mu_tmp > self.initial_gene_pool[self.gene_names[i]]['max']]) and j < max_iter:
-                mu_tmp = np.random.normal(mu, sigma_tmp)
-                sigma_tmp *= 0.99
-                j += 1
-            if j > 1:
-                sigma = sigma_tmp
-            mu_new.append(mu_tmp if j < max_iter else mu)
-            # Adapt sigma (Beyer1995, p.5)
-            xi = np.exp(self.sigma_adapt*np.random.randn())
-            sigma_new.append(sigma*xi)
-        return mu_new, sigma_new
-
-    def __create_new_member(self, sampling_func=np.random.uniform):
-        """Create a new population member from the initial gene pool"""
-        genes = []
-        sigma = []
-        for i, (key, value) in enumerate(self.initial_gene_pool.items()):
-            value_tmp = value.copy()
-            value_tmp['size'] = 1
-            sigma.append(value_tmp.pop('sigma'))
-            genes.append(self.__sample_gene(sampling_func, **value_tmp)[0])
-        new_member = [genes, sigma]
-        already_exists = (self.pop.loc[:, self.gene_names] == genes).all(1).any()
-        if already_exists:
-            new_member = self.__create_new_member(sampling_func)
-        return new_member
+            # partial sort of the fitness values, members with undefined fitness cannot become winners
+            fitness = np.where(np.isnan(pop_fitness), -np.inf, pop_fitness)
+            idx = np.argpartition(fitness, -n_winners)[fitness.size-n_winners:]
+            idx = idx[np.argsort(-fitness[idx], kind='stable')]
+            self.current_winners = self.pop.iloc[idx[~np.isnan(pop_fitness[idx])]]
+        winner_genes, winner_sigmas, _ = self.__to_arrays(self.current_winners)
+        return winner_genes, winner_sigmas
+
+    def __mutate(self, parent_genes, parent_sigmas, max_iter=1000):
+        """Create mutations of parents (one per row), based on a gaussian distribution for each gene"""
+        mins, maxs = self._mins, self._maxs
+
+        # draw all genes at once and re-draw genes outside of the gene pool boundaries with decreasing sigma
+        mu_new = np.random.normal(parent_genes, parent_sigmas)
+        sigma_tmp = parent_sigmas.copy()
+        n_draws = np.zeros(parent_genes.shape, dtype=np.int64)
+        invalid = (mu_new < mins) | (mu_new > maxs)
+        while invalid.any():
+            mu_new[invalid] = np.random.normal(parent_genes[invalid], sigma_tmp[invalid])
+            sigma_tmp[invalid] *= 0.99
+            n_draws[invalid] += 1
+            invalid &= ((mu_new < mins) | (mu_new > maxs)) & (n_draws < max_iter)
+        failed = n_draws >= max_iter
+        mu_new[failed] = parent_genes[failed]
+        sigma = np.where(n_draws > 1, sigma_tmp, parent_sigmas)
+
+        # Adapt sigma (Beyer1995, p.5)
+        xi = np.exp(self.sigma_adapt*np.random.randn(*sigma.shape))
+        return mu_new, sigma*xi
+
+    def __create_new_members(self, n_new, sampling_func=np.random.uniform):
+        """Create n_new population members from the initial gene pool, that do not exist in the current population"""
+        genes = np.empty((n_new, self.num_genes))
+        known_genes = self.gene_keys.copy()
+
+        # sample all members at once and re-sample only those that already exist
+        pending = np.arange(n_new)
+        while pending.size:
+            for j, value in enumerate(self.initial_gene_pool.values()):
+                value_tmp = value.copy()
+                value_tmp['size'] = pending.size
+                value_tmp.pop('sigma')
+                genes[pending, j] = self.__sample_gene(sampling_func, **value_tmp)
+            accepted = np.zeros(pending.size, dtype=bool)
+            for k, i in enumerate(pending):
+                key = genes[i].tobytes()
+                if key not in known_genes:
+                    known_genes.add(key)
+                    accepted[k] = True
+            pending = pending[~accepted]
+        return genes, np.tile(self._init_sigmas, (n_new, 1))
 
     def __create_parent_pairs(self, n_parent_pairs):
         """Create n_parent_pairs parent combinations. The occurrence probability for each parent is based on that
-        parent's fitness"""
-        parents = []
-
-        # Reproduction probability for each parent is based on its relative fitness
-        pop_fitness = self.pop['fitness'].sum()
-        parent_repro = self.current_winners['fitness'].copy()
+        parent's fitness. Returns the genes and sigmas of the parents, with shape (n_parent_pairs, 2, num_genes)"""
+        pop_genes, pop_sigmas, pop_fitness = self.__to_arrays(self.pop)
+        winner_genes, winner_sigmas, parent_repro = self.__to_arrays(self.current_winners)
 
         # Set -inf and NaN to 0 since np.choice can only handle positive floats or ints
         # Safety measure, should not occur in the first place
-        parent_repro[np.isinf(parent_repro)] = 0.0
-        parent_repro[np.isnan(parent_repro)] = 0.0
+        parent_repro = np.where(np.isinf(parent_repro) | np.isnan(parent_repro), 0.0, parent_repro)
 
         # Convert fitness to list of normalized choice probabilities
-        parent_repro = np.abs(parent_repro.to_numpy())
+        parent_repro = np.abs(parent_repro)
         parent_repro_sum = parent_repro.sum()
+        if parent_repro_sum <= 0:
+            # there are no winners with a valid fitness, hence all parents are drawn from the whole population
+            pop_idx = np.random.randint(pop_genes.shape[0], size=(n_parent_pairs, 2))
+            return pop_genes[pop_idx], pop_sigmas[pop_idx]
         parent_repro_mean = parent_repro_sum/len(parent_repro)
-        total_repro_mean = pop_fitness/self.pop.shape[0]
+        total_repro_mean = np.nansum(pop_fitness)/pop_fitness.shape[0]
         parent_repro_total = parent_repro_mean/(parent_repro_mean + total_repro_mean)
-        parent_repro /= np.abs(parent_repro_sum)
-
-        # Get a list containing the indices of all population members
-        pop_indices = self.pop.index.values
-        parent_indices = self.current_winners.index.values
-        for n in range(n_parent_pairs):
-            parent_pair = []
-            for _ in range(2):
-                winner_parent = np.random.choice([True, False], p=[parent_repro_total, 1-parent_repro_total])
-                if winner_parent:
-                    p_idx = np.random.choice(parent_indices, replace=False, p=parent_repro)
-                    parent_pair.append(self.current_winners.loc[p_idx, :])
-                else:
-                    p_idx = np.random.choice(pop_indices, replace=False)
-                    parent_pair.append(self.pop.loc[p_idx, :])
-            parents.append(tuple(parent_pair))
-        return parents
+        parent_repro /= parent_repro_sum
 
-    def __crossover(self, parent_pairs, n_tries=10):
+        # Each parent is either drawn from the current winners (based on their fitness) or from the whole population
+        from_winners = np.random.uniform(size=(n_parent_pairs, 2)) < parent_repro_total
+        winner_idx = np.random.choice(len(parent_repro), size=(n_parent_pairs, 2), p=parent_repro)
+        pop_idx = np.random.randint(pop_genes.shape[0], size=(n_parent_pairs, 2))
+        parent_genes = np.where(from_winners[..., None], winner_genes[winner_idx], pop_genes[pop_idx])
+        parent_sigmas = np.where(from_winners[..., None], winner_sigmas[winner_idx], pop_sigmas[pop_idx])
+        return parent_genes, parent_sigmas
+
+    def __crossover(self, parent_genes, parent_sigmas, n_tries=10):
         """Create a child from each parent pair. Each child gene is uniformly chosen from one of its parents
 
         If the child already exists in the current population, new genes are chosen, but maximal n_tries times.
         """
-        childs = []
-        for parents in parent_pairs:
-            count = 0
-            while count < n_tries:
-                child_genes = []
-                child_sigma = []
-                for g, gene in enumerate(self.initial_gene_pool):
-                    choice = np.random.uniform()
-                    if choice > 0.5:
-                        child_genes.append(parents[0][gene])
-                        child_sigma.append(parents[0]['sigma'][g])
-                    else:
-                        child_genes.append(parents[1][gene])
-                        child_sigma.append(parents[1]['sigma'][g])
-                already_exists = (self.pop.loc[:, self.gene_names] == child_genes).all(1).any()
-                if not already_exists and (child_genes, child_sigma) not in childs:
-                    break
-                count += 1
-            if count < n_tries:
-                childs.append((child_genes, child_sigma))
-        return childs
+        n_childs = parent_genes.shape[0]
+        child_genes = np.empty((n_childs, self.num_genes))
+        child_sigmas = np.empty((n_childs, self.num_genes))
+
+        # gene sets of the current population and of all accepted children, used to detect already existing children
+        known_genes = self.gene_keys.copy()
+
+        # create all children at once and re-create only those that already exist
+        accepted = np.zeros(n_childs, dtype=bool)
+        pending = np.arange(n_childs)
+        for _ in range(n_tries):
+            if not pending.size:
+                break
+            choice = np.random.uniform(size=(pending.size, self.num_genes)) > 0.5
+            child_genes[pending] = np.where(choice, parent_genes[pending, 0], parent_genes[pending, 1])
+            child_sigmas[pending] = np.where(choice, parent_sigmas[pending, 0], parent_sigmas[pending, 1])
+            for i in pending:
+                key = child_genes[i].tobytes()
+                if key not in known_genes:
+                    known_genes.add(key)
+                    accepted[i] = True
+            pending = pending[~accepted[pending]]
+        return child_genes[accepted], child_sigmas[accepted]
+
+    def __to_arrays(self, pop):
+        """Returns the genes, sigmas and fitness of all members of a population data frame as arrays"""
+        genes = pop.loc[:, self.gene_names].to_numpy(dtype=np.float64)
+        sigmas = np.asarray(pop['sigma'].tolist(), dtype=np.float64).reshape(-1, self.num_genes)
+        return genes, sigmas, pop['fitness'].to_numpy(dtype=np.float64)
 
     @staticmethod
     def __sample_gene(sampling_func, **kwargs):
@@ -715,34 +749,74 @@ class DifferentialEvolutionAlgorithm(GeneticAlgorithmTemplate):
 class GSGeneticAlgorithm(GeneticAlgorithmTemplate):
     from scipy.spatial.distance import cdist
 
-    def __init__(self, gs_config, fitness_measure=cdist, **fitness_kwargs):
+    def __init__(self, gs_config, fitness_measure=cdist, n_workers=1, **fitness_kwargs):
+        """Genetic algorithm that evaluates the fitness of a population via a grid search over its genes.
+
+        Parameters
+        ----------
+        gs_config
+            Keyword arguments for `grid_search` (circuit template, parameter map, simulation settings, inputs, outputs
+            and backend initialization arguments).
+        fitness_measure
+            Distance measure between the simulated outputs and the target. The fitness is its inverse.
+        n_workers
+            Number of processes the population is distributed over for the fitness evaluation. Parallelization is
+            opt-in: the default of 1 evaluates the whole population in the calling process, since every worker
+            re-compiles the model in its own build directory, which only pays off for expensive simulations.
+        fitness_kwargs
+            Additional keyword arguments that are passed onto `fitness_measure`.
+
+        """
         super().__init__()
 
         self.fitness_measure = fitness_measure
         self.fitness_kwargs = fitness_kwargs
         self.gs_config = gs_config
+        self.n_workers = n_workers
 
     def eval_fitness(self, target: list, **kwargs):
         param_grid = self.pop.drop(['fitness', 'sigma', 'results'], axis=1)
 
-        results, params = grid_search(circuit_template=self.gs_config['circuit_template'],
-                                      param_grid=param_grid,
-                                      param_map=self.gs_config['param_map'],
-                                      simulation_time=self.gs_config['simulation_time'],
-                                      dt=self.gs_config['step_size'],
-                                      sampling_step_size=self.gs_config['sampling_step_size'],
-                                      permute_grid=False,
-                                      inputs=self.gs_config['inputs'],
-                                      outputs=self.gs_config['outputs'].copy(),
-                                      init_kwargs=self.gs_config['init_kwargs'],
-                                      **kwargs
-                                      )
+        gs_kwargs = dict(circuit_template=self.gs_config['circuit_template'],
+                         param_map=self.gs_config['param_map'],
+                         simulation_time=self.gs_config['simulation_time'],
+                         step_size=self.gs_config['step_size'],
+                         sampling_step_size=self.gs_config['sampling_step_size'],
+                         permute_grid=False,
+                         inputs=self.gs_config['inputs'],
+                         **kwargs)
+
+        if self.n_workers > 1 and param_grid.shape[0] > 1:
+
+            # simulate chunks of the population in separate processes, each with its own build directory
+            init_kwargs = self.gs_config['init_kwargs'] or {}
+            build_dir = init_kwargs.get('build_dir', os.getcwd())
+            with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = []
+                for i, chunk in enumerate(np.array_split(np.arange(param_grid.shape[0]), self.n_workers)):
+                    futures.append(executor.submit(grid_search,
+                                                   param_grid=param_grid.iloc[chunk],
+                                                   outputs=self.gs_config['outputs'].copy(),
+                                                   init_kwargs={**init_kwargs,
+                                                                'build_dir': f"{build_dir}/ga_worker_{i}"},
+                                                   **gs_kwargs))
+                chunk_results = [future.result() for future in futures]
+            results = pd.concat([res[0] for res in chunk_results], axis=1)
+            params = pd.concat([res[1] for res in chunk_results])
 
-        for i, candidate_genes in enumerate(param_grid.values):
-            candidate_out = results.loc[:, tuple(candidate_genes)].values.T
-            target_reshaped = np.array(target)[None, :]
-            dist = self.fitness_measure(candidate_out, target_reshaped, **self.fitness_kwargs)
-            self.pop.at[i, 'fitness'] = float(1 / dist)
+        else:
+            results, params = grid_search(param_grid=param_grid,
+                                          outputs=self.gs_config['outputs'].copy(),
+                                          init_kwargs=self.gs_config['init_kwargs'],
+                                          **gs_kwargs)
+
+        # collect the outputs of all candidates (the circuit of each candidate is named by the index of params) and
+        # compute their distances to the target at once
+        candidate_idx = results.columns.get_level_values(1).get_indexer(params.index)
+        candidate_outs = results.values[:, candidate_idx].T
+        target_reshaped = np.array(target)[None, :]
+        dists = self.fitness_measure(candidate_outs, target_reshaped, **self.fitness_kwargs)
+        self.pop['fitness'] = 1 / np.ravel(dists)
 
 
 class CGSGeneticAlgorithm(GeneticAlgorithmTemplate):
@@ -0,0 +1,174 @@
+"""Test suite for the code generation and compilation functionalities of the Fortran backend.
+"""
+
+# external imports
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+# pyrates internal imports
+from pyrates.backend import fortran_backend
+from pyrates.backend.fortran_backend import FortranGen
+
+# meta infos
+__author__ = "Richard Gast"
+__status__ = "Development"
+
+requires_gfortran = pytest.mark.skipif(shutil.which("gfortran") is None, reason="requires gfortran")
+
+
+###########
+# Utility #
+###########
+
+
+def setup_module():
+    print("\n")
+    print("===============================")
+    print("| Test Suite: Fortran Backend |")
+    print("===============================")
+
+
+def compile_constant(value: str, cache_dir: str, build_dir: str) -> float:
+    """Compiles and evaluates a Fortran subroutine that returns `value`, using `cache_dir` as module cache.
+    """
+    fortran_backend.cache_dir = cache_dir
+    os.makedirs(build_dir, exist_ok=True)
+    source = "      subroutine get_value(a)\n" \
+             "      double precision, intent(out) :: a\n" \
+             f"      a = {value}\n" \
+             "      end\n"
+    return fortran_backend.f2py_compile(source, modulename='pyrates_test', build_dir=build_dir).get_value()
+
+
+#########
+# Tests #
+#########
+
+
+@requires_gfortran
+def test_5_1_concurrent_compilation(tmp_path):
+    """Testing the compilation of Fortran modules by multiple processes:
+
+    Processes that compile the identical module at the same time must not interfere with each other, and the module
+    must end up in the cache exactly once.
+    """
+
+    cache_dir = str(tmp_path / "cache")
+    n = 4
+    with ProcessPoolExecutor(max_workers=n) as executor:
+        results = list(executor.map(compile_constant, ["2.5d0"] * n, [cache_dir] * n,
+                                    [str(tmp_path / f"worker_{i}") for i in range(n)]))
+
+    assert results == [2.5] * n
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_5_2_line_breaks():
+    """Testing the line breaks of long code lines in the fixed-form Fortran code:
+
+    All segments of a broken line have to fit into the 72 columns of fixed-form Fortran, they have to reassemble to the
+    original line, and number literals must never be broken up.
+    """
+
+    number_regex = re.compile(r'[0-9]+\.[0-9]*[dDeE][+-]?[0-9]+')
+    for k in range(20):
+
+        code_line = "dy(1) = " + " + ".join([f"1.5d-3*y({i})*2.0e+{i}" for i in range(k, k+12)])
+        gen = FortranGen()
+        gen.add_indent()
+        gen.add_code_line(code_line)
+        lines = gen.generate().split("\n")
+
+        # each segment fits into 72 columns (tabs count as 8 columns at most)
+        assert len(lines) > 1
+        assert all(len(line.replace("\t", " " * 8)) <= 72 for line in lines)
+
+        # segments reassemble to the original line
+        assert all(line.startswith("     & ") for line in lines[1:])
+        assert lines[0] + "".join([line[7:] for line in lines[1:]]) == "\t" + code_line
+
+        # no break within number literals
+        breaks = FortranGen._find_line_breaks("\t" + code_line, 60)
+        for m in number_regex.finditer("\t" + code_line):
+            assert not any(m.start() < b < m.end() for b in breaks)
+
+
+@requires_gfortran
+def test_5_3_array_assignment_syntax(tmp_path):
+    """Testing the syntax of array assignments generated for the Fortran backend:
+
+    Runs of consecutive indices are assigned via array constructors that may span multiple lines, which has to be valid
+    fixed-form Fortran.
+    """
+
+    values = {i: f"{i}.5d-3*x({i})" for i in range(1, 13)}
+    values.update({15: "2.0d0", 17: "-1.0d0", 18: "x(2)**2"})
+
+    gen = FortranGen()
+    gen.add_indent()
+    gen.add_code_line("subroutine assign(y,x)")
+    gen.add_linebreak()
+    gen.add_code_line("double precision, dimension(20), intent(out) :: y")
+    gen.add_linebreak()
+    gen.add_code_line("double precision, dimension(20), intent(in) :: x")
+    gen.add_linebreak()
+    gen.add_array_assignment("y", values)
+    gen.add_code_line("end subroutine")
+    gen.add_linebreak()
+
+    fn = tmp_path / "assign.f"
+    fn.write_text(gen.generate())
+    result = subprocess.run(["gfortran", "-fsyntax-only", str(fn)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    assert result.returncode == 0, result.stderr.decode()
+
+
+@requires_gfortran
+def test_5_4_compilation_cache(tmp_path, monkeypatch):
+    """Testing the cache of compiled Fortran modules:
+
+    A module that has been compiled once has to be loaded from the cache instead of being compiled again.
+    """
+
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(fortran_backend, "cache_dir", cache_dir)
+    assert compile_constant("1.5d0", cache_dir, str(tmp_path / "build")) == 1.5
+
+    def compile_again(*args, **kwargs):
+        raise AssertionError("module has been compiled again")
+
+    monkeypatch.setattr(fortran_backend.f2py, "compile", compile_again)
+    assert compile_constant("1.5d0", cache_dir, str(tmp_path / "build")) == 1.5
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_5_5_cache_key(tmp_path, monkeypatch):
+    """Testing the names under which compiled Fortran modules are cached:
+
+    Identical source code compiled with different f2py arguments or compiler settings must not share a cached module.
+    """
+
+    monkeypatch.setattr(fortran_backend, "cache_dir", str(tmp_path / "cache"))
+    modulenames = []
+
+    def record_modulename(source, modulename, **kwargs):
+        modulenames.append(modulename)
+        return 1
+
+    monkeypatch.setattr(fortran_backend.f2py, "compile", record_modulename)
+    monkeypatch.delenv("FFLAGS", raising=False)
+    source = "      subroutine get_value(a)\n      double precision, intent(out) :: a\n      a = 1.0d0\n      end\n"
+    for extra_args, fflags in [(None, None), (None, None), (["--opt=-O2"], None), (None, "-O0")]:
+        if fflags:
+            monkeypatch.setenv("FFLAGS", fflags)
+        with pytest.raises(RuntimeError):
+            fortran_backend.f2py_compile(source, modulename='pyrates_test', build_dir=str(tmp_path),
+                                         extra_args=extra_args)
+
+    assert modulenames[0] == modulenames[1]
+    assert len(set(modulenames)) == 3
@@ -0,0 +1,68 @@
+"""Test suite for the interpolation functions that the backends use to evaluate delayed state variables.
+"""
+
+# external imports
+import numpy as np
+import pytest
+
+# pyrates internal imports
+from pyrates.backend.funcs import pr_interp_1d, pr_interp_nd
+
+# meta infos
+__author__ = "Richard Gast"
+__status__ = "Development"
+
+
+###########
+# Utility #
+###########
+
+
+def setup_module():
+    print("\n")
+    print("=====================================")
+    print("| Test Suite: Backend Interpolation |")
+    print("=====================================")
+
+
+#########
+# Tests #
+#########
+
+
+def test_4_1_interp_nd_linear_extrapolation():
+    """Testing the linear fallback of `pr_interp_nd`, which is used for buffers with less than 4 unique time points:
+
+    Delays that reach beyond the buffered time points have to be extrapolated linearly along the end segments instead
+    of being clamped to the boundary values.
+    """
+
+    x = np.asarray([0.0, 0.1, 0.2])
+    y = np.asarray([[0.0, 0.05, 0.07],
+                    [1.0, 2.0, 2.5]])
+    t = 0.25
+
+    # evaluation points beyond both ends of the buffer (t - x_new = 0.3 and 0.05) and inside of it (0.15)
+    x_new = np.asarray([-0.05, 0.2, 0.1])
+    y_idx = [0, 1, 1]
+    y_new = pr_interp_nd(x, y, x_new, y_idx, t)
+
+    assert y_new == pytest.approx([0.09, 1.5, 2.25])
+
+
+def test_4_2_interp_1d_bounds():
+    """Testing the cubic interpolation of `pr_interp_1d`:
+
+    Values within the range of `x` are interpolated (independent of the ordering of `x`), whereas values outside of
+    that range raise a ValueError instead of being extrapolated.
+    """
+
+    x = np.linspace(0.0, 1.0, 11)
+    y = x**3
+    perm = np.random.RandomState(0).permutation(len(x))
+
+    assert pr_interp_1d(x[perm], y[perm], np.asarray([0.25, 0.55])) == pytest.approx([0.25**3, 0.55**3])
+    with pytest.raises(ValueError):
+        pr_interp_1d(x, y, 1.1)
+    with pytest.raises(ValueError):
+        pr_interp_1d(x, y, np.asarray([0.5, -0.1]))
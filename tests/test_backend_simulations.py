@@ -42,12 +42,12 @@ def nmrse(x: np.ndarray,
         Normalized root mean squared error.
     """
 
-    max_val = np.max((np.max(x, axis=0), np.max(y, axis=0)))
-    min_val = np.min((np.min(x, axis=0), np.min(y, axis=0)))
+    max_val = max(np.max(x), np.max(y))
+    min_val = min(np.min(x), np.min(y))
 
     diff = x - y
 
-    return np.sqrt(np.sum(diff ** 2, axis=0)) / (max_val - min_val)
+    return np.sqrt(np.einsum('i...,i...->...', diff, diff)) / (max_val - min_val)
 
 
 #########
@@ -0,0 +1,229 @@
+"""Test suite for the genetic algorithm based model optimization.
+"""
+
+# external imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# pyrates internal imports
+from pyrates.utility.genetic_algorithm import GeneticAlgorithmTemplate, GSGeneticAlgorithm
+
+# meta infos
+__author__ = "Richard Gast"
+__status__ = "Development"
+
+
+###########
+# Utility #
+###########
+
+
+def setup_module():
+    print("\n")
+    print("=================================")
+    print("| Test Suite: Genetic Algorithm |")
+    print("=================================")
+
+
+class DistanceGA(GeneticAlgorithmTemplate):
+    """Genetic algorithm with the inverse euclidean distance between the genes of a member and the target as fitness.
+    """
+
+    def eval_fitness(self, target: list, **kwargs):
+        genes = self.pop.loc[:, self.gene_names].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            self.pop['fitness'] = 1 / np.sqrt(np.sum((genes - np.asarray(target))**2, axis=1))
+
+
+def gs_population(etas: list) -> pd.DataFrame:
+    """Creates a population of QIF models that differ in their excitability `eta`.
+    """
+    return pd.DataFrame({'eta': etas, 'fitness': 0.0, 'sigma': [[0.1]] * len(etas),
+                         'results': [[] for _ in etas]})
+
+
+#########
+# Tests #
+#########
+
+
+def test_6_1_gs_fitness_workers(tmp_path):
+    """Testing the fitness evaluation of the grid-search based genetic algorithm:
+
+    Distributing the population over multiple worker processes has to yield the same fitness values as evaluating it
+    in a single process.
+    """
+
+    gs_config = {'circuit_template': "model_templates.montbrio.simple_montbrio.QIF_exc",
+                 'param_map': {'eta': {'vars': ['Op_e/eta'], 'nodes': ['p']}},
+                 'simulation_time': 1.0, 'step_size': 1e-3, 'sampling_step_size': 1e-2,
+                 'inputs': {}, 'outputs': {'r': 'p/Op_e/r'},
+                 'init_kwargs': {'backend': 'numpy', 'solver': 'euler', 'build_dir': str(tmp_path)}}
+    target = list(np.linspace(0.2, 0.4, 100))
+    etas = [-5.0, -4.0, -3.0, -2.0]
+
+    fitness = []
+    for n_workers in [1, 2]:
+        ga = GSGeneticAlgorithm(gs_config, n_workers=n_workers)
+        ga.gene_names = ['eta']
+        ga.pop = gs_population(etas)
+        ga.eval_fitness(target)
+        fitness.append(ga.pop['fitness'].values)
+
+    assert fitness[1] == pytest.approx(fitness[0])
+    assert np.argmax(fitness[1]) == 1
+
+
+def test_6_2_infinite_fitness():
+    """Testing the genetic algorithm with a population that contains the target itself:
+
+    The member that matches the target has an infinite fitness and thus no valid reproduction probability. Parents have
+    to be drawn from the whole population instead of raising an error.
+    """
+
+    np.random.seed(0)
+    gene_pool = {'a': {'min': 0., 'max': 4., 'size': 5, 'sigma': 0.5},
+                 'b': {'min': -2., 'max': 2., 'size': 5, 'sigma': 0.5}}
+    ga = DistanceGA()
+    winner = ga.run(gene_pool, target=[1.0, -1.0], max_iter=3, n_winners=1, n_parent_pairs=5, n_new=2,
+                    sigma_adapt=0.1, gene_sampling_func=lambda min, max, size: np.linspace(min, max, size),
+                    new_member_sampling_func=lambda min, max, size: np.random.uniform(min, max, size))
+
+    assert winner.loc[:, ['a', 'b']].to_numpy(dtype=np.float64).tolist() == [[1.0, -1.0]]
+    assert np.isinf(winner['fitness'].values[0])
+
+
+def test_6_3_seeded_run():
+    """Testing a full run of the genetic algorithm with a synthetic fitness function:
+
+    Runs with the same random seed have to yield the same winner, which has to be close to the target, and the final
+    population must not contain duplicate members.
+    """
+
+    gene_pool = {'a': {'min': 0., 'max': 10., 'size': 10, 'sigma': 0.5},
+                 'b': {'min': -5., 'max': 5., 'size': 10, 'sigma': 0.5},
+                 'c': {'min': 1., 'max': 2., 'size': 3, 'sigma': 0.1}}
+    target = [3.3, -1.7, 1.5]
+
+    winners = []
+    for _ in range(2):
+        np.random.seed(0)
+        ga = DistanceGA()
+        winner = ga.run(gene_pool, target=target, max_iter=30, n_winners=3, n_parent_pairs=20, n_new=5,
+                        sigma_adapt=0.1, max_stagnation_steps=5)
+        winners.append(winner.loc[:, ['a', 'b', 'c', 'fitness']].to_numpy(dtype=np.float64))
+        assert not ga.pop.duplicated(subset=ga.gene_names).any()
+
+    assert np.array_equal(winners[0], winners[1])
+    assert winners[0][0, :3] == pytest.approx(target, abs=0.1)
+    assert winners[0][0, 3] > 10.0
+
+
+def test_6_4_mutation_bounds():
+    """Testing the mutation of population members:
+
+    Mutated genes have to stay within the boundaries of the gene pool, even for parents at these boundaries and large
+    standard deviations.
+    """
+
+    np.random.seed(1)
+    ga = DistanceGA()
+    ga.num_genes = 2
+    ga.sigma_adapt = 0.1
+    ga._mins = np.asarray([0.0, -1.0])
+    ga._maxs = np.asarray([1.0, 1.0])
+
+    parent_genes = np.tile([[0.0, 1.0], [1.0, -1.0], [0.5, 0.0]], (100, 1))
+    parent_sigmas = np.full(parent_genes.shape, 5.0)
+    genes, sigmas = ga._GeneticAlgorithmTemplate__mutate(parent_genes, parent_sigmas)
+
+    assert genes.shape == parent_genes.shape and sigmas.shape == parent_sigmas.shape
+    assert np.all(genes >= ga._mins) and np.all(genes <= ga._maxs)
+    assert np.all(sigmas > 0.0)
+
+
+def test_6_5_duplicates():
+    """Testing the detection of duplicate population members:
+
+    All but the first occurrence of each gene set have to be reported as duplicates.
+    """
+
+    genes = np.asarray([[1.0, 2.0],
+                        [0.0, 1.0],
+                        [1.0, 2.0],
+                        [1.0, 0.0],
+                        [0.0, 1.0],
+                        [1.0, 2.0]])
+    dupl_idx = GeneticAlgorithmTemplate._GeneticAlgorithmTemplate__find_duplicates(genes)
+
+    assert dupl_idx.tolist() == [2, 4, 5]
+
+
+def test_6_6_candidate_store(tmp_path):
+    """Testing the storage of the fittest candidates in an hdf5 file:
+
+    The file has to be released, even if the run is interrupted by an error.
+    """
+
+    class FailingGA(DistanceGA):
+
+        def eval_fitness(self, target: list, **kwargs):
+            if not self.candidate.empty:
+                raise RuntimeError("fitness evaluation failed")
+            super().eval_fitness(target, **kwargs)
+
+    np.random.seed(0)
+    gene_pool = {'a': {'min': 0., 'max': 4., 'size': 5, 'sigma': 0.5},
+                 'b': {'min': -2., 'max': 2., 'size': 5, 'sigma': 0.5}}
+    fn = str(tmp_path / "candidate.h5")
+    with pytest.raises(RuntimeError):
+        FailingGA().run(gene_pool, target=[1.5, -0.5], max_iter=3, n_winners=1, n_parent_pairs=5, n_new=2,
+                        sigma_adapt=0.1, candidate_save=fn)
+
+    with pd.HDFStore(fn, mode="r") as store:
+        assert store['data'].shape[0] == 1
+
+
+def test_6_7_undefined_fitness():
+    """Testing the genetic algorithm with populations in which no member has a defined fitness:
+
+    Such populations have to be replaced by new populations, and parents have to be drawn from the whole population if
+    there are no winners with a defined fitness.
+    """
+
+    class UndefinedGA(DistanceGA):
+
+        def __init__(self, n_undefined):
+            super().__init__()
+            self.n_undefined = n_undefined
+
+        def eval_fitness(self, target: list, **kwargs):
+            if self.n_undefined > 0:
+                self.n_undefined -= 1
+                self.pop['fitness'] = np.nan
+            else:
+                super().eval_fitness(target, **kwargs)
+
+    gene_pool = {'a': {'min': 0., 'max': 4., 'size': 5, 'sigma': 0.5},
+                 'b': {'min': -2., 'max': 2., 'size': 5, 'sigma': 0.5}}
+    target = [1.5, -0.5]
+
+    # only undefined fitness values
+    np.random.seed(0)
+    winner = UndefinedGA(n_undefined=3).run(gene_pool, target=target, max_iter=3, n_winners=1, n_parent_pairs=5,
+                                            n_new=2, sigma_adapt=0.1)
+    assert winner.empty
+
+    # undefined fitness values in the first generation only
+    np.random.seed(0)
+    winner = UndefinedGA(n_undefined=1).run(gene_pool, target=target, max_iter=3, n_winners=1, n_parent_pairs=5,
+                                            n_new=2, sigma_adapt=0.1)
+    assert np.isfinite(winner['fitness'].values[0])
+
+    # parent selection without winners
+    ga = UndefinedGA(n_undefined=0)
+    ga.run(gene_pool, target=target, max_iter=1, n_winners=1, n_parent_pairs=5, n_new=2, sigma_adapt=0.1)
+    ga.current_winners = ga.pop.iloc[[]]
+    parent_genes, parent_sigmas = ga._GeneticAlgorithmTemplate__create_parent_pairs(4)
+    assert parent_genes.shape == parent_sigmas.shape == (4, 2, 2)